@@ -0,0 +1,19 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_crowler():
+    """Carga crow-lerV2.py como módulo (su nombre no se puede importar directamente)"""
+    spec = importlib.util.spec_from_file_location("crowler", ROOT / "crow-lerV2.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def crowler():
+    return load_crowler()
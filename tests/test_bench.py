@@ -0,0 +1,29 @@
+"""Crow-leo completo de la web sintética del benchmark con SQLite (sin red ni servidor)."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_benchmark_crawl_on_sqlite(tmp_path):
+    # En un proceso aparte: el benchmark cambia Config y lanza la web sintética con multiprocessing
+    result = subprocess.run(
+        [sys.executable, str(ROOT / "crow-lerV2.py"), "--bench-crawl", "150", "--workers", "8",
+         "--backend", "sqlite"],
+        cwd=tmp_path, capture_output=True, text=True, encoding="utf-8", timeout=300,
+        env=dict(os.environ, PYTHONIOENCODING="utf-8"),
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    
+    # 50 hosts x 3 páginas: todas se descargan (200, 404 o sin respuesta) exactamente una vez
+    match = re.search(r"Páginas descargadas\s+(\d+)\s+\(200: (\d+), 404: (\d+), sin respuesta: (\d+)\)",
+                      result.stdout)
+    assert match, result.stdout
+    fetched, ok, not_found, no_response = map(int, match.groups())
+    assert fetched == ok + not_found + no_response == 150
+    assert ok > 100
+    assert "base de datos: sqlite" in result.stdout
@@ -0,0 +1,57 @@
+"""Circuit breaker por host: cerrado -> abierto -> medio abierto."""
+
+import pytest
+
+
+@pytest.fixture
+def breaker(crowler, monkeypatch):
+    monkeypatch.setattr(crowler.Config, "BREAKER_FAILURE_THRESHOLD", 3)
+    monkeypatch.setattr(crowler.Config, "BREAKER_COOLDOWN", 300)
+    monkeypatch.setattr(crowler.Config, "BREAKER_MAX_COOLDOWN", 1000)
+    return crowler.HostCircuitBreaker()
+
+
+def test_opens_after_consecutive_failures(breaker):
+    assert breaker.record_failure("a.onion") is None
+    assert breaker.record_failure("a.onion") is None
+    assert breaker.deferral("a.onion") is None
+    
+    assert breaker.record_failure("a.onion") == 300
+    assert breaker.open_hosts() == ["a.onion"]
+    assert 299 < breaker.deferral("a.onion") <= 300
+    # Ya abierto: los fallos de peticiones en curso no vuelven a abrirlo
+    assert breaker.record_failure("a.onion") is None
+
+
+def test_success_resets_the_count(breaker):
+    breaker.record_failure("a.onion")
+    breaker.record_failure("a.onion")
+    assert breaker.record_success("a.onion") is False
+    assert breaker.record_failure("a.onion") is None
+
+
+def test_failed_probe_reopens_with_doubled_cooldown(breaker):
+    for _ in range(3):
+        breaker.record_failure("a.onion")
+    breaker.begin_probe("a.onion")
+    assert breaker.probing_hosts() == ["a.onion"]
+    assert breaker.open_hosts() == []
+    
+    assert breaker.record_failure("a.onion") == 600
+    breaker.begin_probe("a.onion")
+    assert breaker.record_failure("a.onion") == 1000     # BREAKER_MAX_COOLDOWN
+    assert breaker.snapshot() == {breaker.OPEN: 1, breaker.HALF_OPEN: 0}
+
+
+def test_successful_probe_closes_the_circuit(breaker):
+    for _ in range(3):
+        breaker.record_failure("a.onion")
+    breaker.begin_probe("a.onion")
+    assert breaker.record_success("a.onion") is True
+    assert breaker.deferral("a.onion") is None
+    assert breaker.probing_hosts() == [] and breaker.open_hosts() == []
+
+
+def test_failures_without_host_are_ignored(breaker):
+    assert breaker.record_failure(None) is None
+    assert breaker.open_hosts() == []
@@ -0,0 +1,51 @@
+"""Presupuestos por dominio: fórmula de DomainBudgets.compute y reservas de cupo."""
+
+import pytest
+
+
+@pytest.fixture
+def config(crowler, monkeypatch):
+    for name, value in {
+        "MAX_LINKS_PER_DOMAIN": 15,
+        "BUDGET_MIN": 2,
+        "BUDGET_MAX": 2000,
+        "BUDGET_MIN_SAMPLES": 5,
+        "BUDGET_GROWTH": 2,
+        "BUDGET_YIELD_TARGET": 5,
+        "BUDGET_LATENCY_TARGET": 5,
+    }.items():
+        monkeypatch.setattr(crowler.Config, name, value)
+    return crowler.Config
+
+
+@pytest.mark.parametrize("entry, expected", [
+    ([0, 4, 4, 100, 1.0], 15),          # Sin muestras suficientes: presupuesto inicial
+    ([0, 10, 10, 100, 1.0], 35),        # 15 * 1 + 10 * 2 * 1
+    ([0, 10, 10, 10, 1.0], 19),         # Cosecha pobre: 15 + 20 * (1 / 5)
+    ([0, 10, 5, 50, None], 17),         # La mitad con 200: 15 * 0.5 + 5 * 2 * 1 (sin latencia, sin penalizar)
+    ([0, 10, 10, 100, 10.0], 17),       # Lento: (15 + 20) * (5 / 10)
+    ([0, 10, 0, 0, 1.0], 2),            # No responde nunca: BUDGET_MIN
+    ([0, 10_000, 10_000, 10 ** 6, 1.0], 2000),  # Tope BUDGET_MAX
+])
+def test_compute(crowler, config, entry, expected):
+    assert crowler.DomainBudgets.compute(entry) == expected
+
+
+def test_reserve_and_release(crowler, config):
+    budgets = crowler.DomainBudgets()
+    allowance, queued, _ = budgets.reserve({"a.onion": 100})["a.onion"]
+    assert (allowance, queued) == (15, 0)
+    assert budgets.reserve({"a.onion": 100})["a.onion"][0] == 0
+    
+    # Lo que no llegó a la cola vuelve a estar disponible
+    budgets.release("a.onion", 5)
+    assert budgets.reserve({"a.onion": 100})["a.onion"][:2] == (5, 10)
+
+
+def test_good_host_earns_more_room(crowler, config):
+    budgets = crowler.DomainBudgets()
+    for _ in range(10):
+        budgets.record_fetch("a.onion", True, 1.0)
+        budgets.record_links("a.onion", 10)
+    assert budgets.budget("a.onion") == 35
+    assert budgets.budget("b.onion") == 15
@@ -0,0 +1,112 @@
+"""Exportación incremental: las filas que llegan entre dos exportaciones no se pierden.
+
+Necesita un PostgreSQL de pruebas: CROWLER_TEST_DSN="host=... user=..." (se crea
+y se borra la base de datos crowler_test_export).
+"""
+
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+ROOT = Path(__file__).resolve().parent.parent
+TEST_DB = "crowler_test_export"
+
+
+def load_crowler():
+    spec = importlib.util.spec_from_file_location("crowler", ROOT / "crow-lerV2.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_rows(directory, table):
+    rows = []
+    for path in sorted(directory.glob(f"{table}-*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            rows += [json.loads(line) for line in f]
+    return rows
+
+
+@pytest.fixture
+def crowler():
+    dsn = os.environ.get("CROWLER_TEST_DSN")
+    if not dsn:
+        pytest.skip("CROWLER_TEST_DSN no definido")
+    try:
+        admin = psycopg2.connect(dsn)
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"PostgreSQL no disponible: {e}")
+    admin.autocommit = True
+    
+    crowler = load_crowler()
+    drop = crowler.sql.SQL("DROP DATABASE IF EXISTS {}").format(crowler.sql.Identifier(TEST_DB))
+    admin.cursor().execute(drop)
+    crowler.Config.DB_BACKEND = "postgresql"
+    crowler.Config.DB_DSN = psycopg2.extensions.make_dsn(dsn, dbname=TEST_DB)
+    assert crowler.DatabaseManager.create_database()
+    crowler.DatabaseManager.init_tables()
+    try:
+        yield crowler
+    finally:
+        crowler.DatabaseManager.close_pool()
+        admin.cursor().execute(drop)
+        admin.close()
+
+
+def test_export_picks_up_old_keys_and_updated_placeholders(crowler, tmp_path):
+    storage = crowler.PostgresStorage
+    with crowler.DatabaseManager.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO crowled_pages (url, url_hash, title, status_code) VALUES
+                ('http://a.onion/', 10, 'A', 200),
+                ('http://b.onion/', 20, NULL, 0)
+        """)
+        cursor.execute("INSERT INTO page_links (src_hash, dst_hash) VALUES (100, 200), (300, 400)")
+        conn.commit()
+    
+    exporter = crowler.CrawlExporter(tmp_path, log=lambda message: None)
+    assert exporter.run() == {"crowled_pages": 1, "page_links": 2}
+    assert [row["url_hash"] for row in read_rows(tmp_path, "crowled_pages")] == [10]
+    
+    # Arista que ordena por debajo de las ya exportadas y reserva que se completa
+    with crowler.DatabaseManager.connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO page_links (src_hash, dst_hash) VALUES (-5, 1)")
+        conn.commit()
+        storage.update_page(conn, 20, "B", 200)
+    
+    exporter = crowler.CrawlExporter(tmp_path, log=lambda message: None)
+    assert exporter.run() == {"crowled_pages": 1, "page_links": 1}
+    
+    links = [(row["src_hash"], row["dst_hash"]) for row in read_rows(tmp_path, "page_links")]
+    assert sorted(links) == [(-5, 1), (100, 200), (300, 400)]
+    pages = {row["url_hash"]: row for row in read_rows(tmp_path, "crowled_pages")}
+    assert pages[20]["title"] == "B" and pages[20]["status_code"] == 200
+    
+    # Sin cambios no se exporta nada
+    exporter = crowler.CrawlExporter(tmp_path, log=lambda message: None)
+    assert exporter.run() == {"crowled_pages": 0, "page_links": 0}
+
+
+def test_export_gives_up_on_transactions_left_open(crowler, tmp_path):
+    with crowler.DatabaseManager.connection() as conn:
+        conn.cursor().execute("INSERT INTO page_links (src_hash, dst_hash) VALUES (1, 2)")
+        conn.commit()
+    
+    # Sesión "idle in transaction" con un id de transacción asignado
+    idle = psycopg2.connect(crowler.Config.DB_DSN)
+    try:
+        idle.cursor().execute("SELECT pg_current_xact_id()")
+        crowler.Config.EXPORT_WAIT_TIMEOUT = 0.5
+        messages = []
+        with pytest.raises(Exception, match="transacciones abiertas"):
+            crowler.CrawlExporter(tmp_path, log=messages.append).run()
+        assert any("esperando" in message for message in messages)
+    finally:
+        idle.close()
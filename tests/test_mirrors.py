@@ -0,0 +1,60 @@
+"""SimHash de NearDuplicateIndex: coincide con la definición directa y agrupa copias."""
+
+import hashlib
+import random
+
+import pytest
+
+VOCABULARY = [f"palabra{i}" for i in range(500)]
+
+
+def words(seed, count=300):
+    rng = random.Random(seed)
+    return [rng.choice(VOCABULARY) for _ in range(count)]
+
+
+def reference_simhash(words, size):
+    """SimHash contado bit a bit, sin el sumador por columnas"""
+    shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+    counts = [0] * 64
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            counts[bit] += (value >> bit) & 1
+    value = sum(1 << bit for bit in range(64) if counts[bit] > len(shingles) // 2)
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def distance(a, b):
+    return bin((a ^ b) & 0xFFFFFFFFFFFFFFFF).count("1")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fingerprint_matches_the_reference(crowler, seed):
+    text = words(seed)
+    fingerprint = crowler.NearDuplicateIndex.fingerprint(text)
+    assert fingerprint == reference_simhash(text, crowler.Config.MIRROR_SHINGLE_WORDS)
+    assert -(1 << 63) <= fingerprint < 1 << 63
+
+
+def test_short_pages_have_no_fingerprint(crowler):
+    assert crowler.NearDuplicateIndex.fingerprint(words(0, count=10)) is None
+    assert crowler.NearDuplicateIndex.fingerprint([]) is None
+
+
+def test_copies_are_close_and_other_pages_are_not(crowler):
+    fingerprint = crowler.NearDuplicateIndex.fingerprint
+    original = words(1)
+    mirror = list(original)
+    mirror[150] = "cambiada"
+    
+    assert fingerprint(original) == fingerprint(list(original))
+    assert distance(fingerprint(original), fingerprint(mirror)) <= crowler.Config.MIRROR_MAX_DISTANCE
+    assert distance(fingerprint(original), fingerprint(words(2))) > crowler.Config.MIRROR_MAX_DISTANCE
+
+
+def test_bands_split_the_fingerprint(crowler):
+    fingerprint = crowler.NearDuplicateIndex.fingerprint(words(3))
+    bands = crowler.NearDuplicateIndex.bands(fingerprint)
+    assert len(bands) == crowler.NearDuplicateIndex.BANDS
+    assert sum(band << (16 * i) for i, band in enumerate(bands)) == fingerprint & 0xFFFFFFFFFFFFFFFF
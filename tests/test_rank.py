@@ -0,0 +1,43 @@
+"""PageRank vectorizado frente a grafos pequeños calculados a mano."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def ranks(crowler, edges, **options):
+    src = np.array([a for a, _ in edges], dtype=np.int64)
+    dst = np.array([b for _, b in edges], dtype=np.int64)
+    nodes, rank, in_degree, iterations = crowler.LinkGraph.pagerank(src, dst, **options)
+    return dict(zip(nodes.tolist(), rank.tolist())), dict(zip(nodes.tolist(), in_degree.tolist())), iterations
+
+
+def test_cycle_is_uniform(crowler):
+    rank, in_degree, _ = ranks(crowler, [(1, 2), (2, 3), (3, 1)])
+    assert rank == pytest.approx({1: 1 / 3, 2: 1 / 3, 3: 1 / 3})
+    assert in_degree == {1: 1, 2: 1, 3: 1}
+
+
+def test_dangling_page_spreads_its_rank(crowler):
+    # 1 -> 2, 2 -> 1, 1 -> 3 y 3 sin enlaces, con d = 0.85:
+    #   r3 = 0.05 + 0.85 (r1 / 2 + r3 / 3) = r2,  r1 = 0.05 + 0.85 (r2 + r3 / 3)
+    #   => r2 = r3 = 57/188, r1 = 37/94
+    rank, in_degree, iterations = ranks(crowler, [(1, 2), (2, 1), (1, 3)], damping=0.85,
+                                        max_iterations=1000, tolerance=1e-12)
+    assert rank == pytest.approx({1: 37 / 94, 2: 57 / 188, 3: 57 / 188}, abs=1e-9)
+    assert sum(rank.values()) == pytest.approx(1.0)
+    assert in_degree == {1: 1, 2: 1, 3: 1}
+    assert iterations < 1000
+
+
+def test_fingerprints_are_kept_as_node_ids(crowler):
+    big = -(1 << 62)
+    rank, in_degree, _ = ranks(crowler, [(big, 7), (5, 7)])
+    assert set(rank) == {big, 5, 7}
+    assert in_degree[7] == 2
+    assert rank[7] > rank[5] == pytest.approx(rank[big])
+
+
+def test_empty_graph(crowler):
+    rank, in_degree, iterations = ranks(crowler, [])
+    assert rank == {} and in_degree == {} and iterations == 0
@@ -0,0 +1,50 @@
+"""Filtro de URLs vistas: sin falsos negativos, tasa de error acotada y guardado en disco."""
+
+import random
+
+
+def test_added_fingerprints_are_always_found(crowler):
+    seen = crowler.SeenUrlFilter(capacity=1000, error_rate=0.01)
+    fingerprints = [crowler.url_fingerprint(f"http://a.onion/{i}") for i in range(5000)]
+    seen.update(fingerprints)
+    
+    # Supera la capacidad inicial: el filtro crece en vez de perder elementos
+    assert len(seen.filters) > 1
+    assert all(fingerprint in seen for fingerprint in fingerprints)
+
+
+def test_false_positive_rate_stays_near_the_target(crowler):
+    seen = crowler.SeenUrlFilter(capacity=10_000, error_rate=0.01)
+    seen.update(crowler.url_fingerprint(f"http://a.onion/{i}") for i in range(10_000))
+    
+    rng = random.Random(1)
+    trials = 20_000
+    false_positives = sum(rng.getrandbits(64) - (1 << 63) in seen for _ in range(trials))
+    assert false_positives / trials < 0.02
+
+
+def test_save_and_load_round_trip(crowler, tmp_path):
+    seen = crowler.SeenUrlFilter(capacity=100, error_rate=0.01)
+    fingerprints = [crowler.url_fingerprint(f"http://b.onion/{i}") for i in range(300)]
+    seen.update(fingerprints)
+    seen.max_crowled_id = 42
+    path = tmp_path / "seen.bloom"
+    seen.save(path)
+    
+    loaded = crowler.SeenUrlFilter.load(path)
+    assert loaded is not None
+    assert loaded.max_crowled_id == 42
+    assert len(loaded) == len(seen)
+    assert [f.bits for f in loaded.filters] == [f.bits for f in seen.filters]
+    assert all(fingerprint in loaded for fingerprint in fingerprints)
+
+
+def test_load_rejects_missing_or_truncated_files(crowler, tmp_path):
+    path = tmp_path / "seen.bloom"
+    assert crowler.SeenUrlFilter.load(path) is None
+    
+    seen = crowler.SeenUrlFilter(capacity=100, error_rate=0.01)
+    seen.add(1)
+    seen.save(path)
+    path.write_bytes(path.read_bytes()[:-10])
+    assert crowler.SeenUrlFilter.load(path) is None
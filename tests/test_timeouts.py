@@ -0,0 +1,58 @@
+"""Timeouts por host derivados de la latencia observada (LatencyTracker.timeouts)."""
+
+import pytest
+
+
+@pytest.fixture
+def tracker(crowler, monkeypatch):
+    for name, value in {
+        "REQUEST_CONNECT_TIMEOUT": 20,
+        "REQUEST_TIMEOUT": 20,
+        "TIMEOUT_MIN_SAMPLES": 3,
+        "TIMEOUT_GLOBAL_MIN_SAMPLES": 100,
+        "TIMEOUT_CONNECT_FACTOR": 2.0,
+        "TIMEOUT_READ_FACTOR": 1.5,
+        "TIMEOUT_MIN_CONNECT": 8,
+        "TIMEOUT_MIN_READ": 4,
+        "TIMEOUT_MAX": 90,
+    }.items():
+        monkeypatch.setattr(crowler.Config, name, value)
+    return crowler.LatencyTracker()
+
+
+def test_unknown_host_uses_the_defaults(tracker):
+    assert tracker.timeouts("a.onion") == (20, 20)
+    tracker.record_timeout("a.onion")
+    assert tracker.timeouts("a.onion") == (40, 40)
+
+
+def test_host_history_sets_the_timeouts(tracker):
+    for _ in range(3):
+        tracker.record("a.onion", 10.0)
+    # media 10, desviación 5 -> 3.75 -> 2.8125: estimación 10 + 4 * 2.8125 = 21.25
+    assert tracker.timeouts("a.onion") == pytest.approx((42.5, 31.875))
+    
+    # Cada timeout duplica el margen hasta TIMEOUT_MAX
+    tracker.record_timeout("a.onion")
+    assert tracker.timeouts("a.onion") == pytest.approx((85.0, 63.75))
+    tracker.record_timeout("a.onion")
+    assert tracker.timeouts("a.onion") == (90, 90)
+    
+    # La siguiente respuesta quita el margen extra
+    tracker.record("a.onion", 10.0)
+    assert tracker.timeouts("a.onion") == pytest.approx((36.875, 27.65625))
+
+
+def test_fast_host_is_floored_at_the_minimums(tracker):
+    for _ in range(3):
+        tracker.record("a.onion", 1.0)
+    assert tracker.timeouts("a.onion") == (8, 4)
+
+
+def test_global_p95_backs_unknown_hosts(tracker):
+    for i in range(100):
+        tracker.record(f"h{i}.onion", 0.5 if i < 90 else 30.0)
+    # El p95 cae en el cubo de ~33.6 s (0.05 * 2 ** (37 / 4))
+    p95 = 0.05 * 2 ** (37 / 4)
+    assert tracker.timeouts("new.onion") == pytest.approx((min(90, 2 * p95), min(90, 1.5 * p95)))
+    assert tracker.snapshot()["samples"] == 100